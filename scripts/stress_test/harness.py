@@ -1,7 +1,10 @@
 import asyncio
+import random
 import time
+import uuid
 import httpx
 import statistics
+from collections import Counter
 from typing import List, Dict, Any
 from .miner_simulator import MinerSimulator
 
@@ -14,6 +17,7 @@ class StressHarness:
         self.semaphore = asyncio.Semaphore(concurrency)
         self.timeout = timeout
         self.results = []
+        self.error_counts = Counter()
         self.client = httpx.AsyncClient(verify=False, timeout=timeout)
 
     async def run_miner_session(self, simulator: MinerSimulator, force_duplicate_id: str = None, malformed: bool = False) -> Dict[str, Any]:
@@ -70,9 +74,10 @@ class StressHarness:
         return stats
 
     async def _perform_step_with_retry(self, name: str, url: str, payload: Any, stats: dict) -> Any:
-        """Helper to perform a step with exponential backoff for 429 errors."""
+        """Helper to perform a step with jittered exponential backoff for 429 errors."""
         max_retries = 5
-        backoff = 2 # seconds
+        base_backoff = 0.05  # seconds
+        backoff_cap = 2.0
 
         for i in range(max_retries):
             step_start = time.perf_counter()
@@ -92,9 +97,14 @@ class StressHarness:
                     return resp.json()
                 elif resp.status_code == 429:
                     stats["retries"] += 1
-                    # print(f"  [429] {stats['miner_id']} rate limited on {name}, retrying in {backoff}s...")
-                    await asyncio.sleep(backoff)
-                    backoff *= 2
+                    # Honor Retry-After if the server sends one; otherwise use
+                    # "full jitter" backoff so retrying miners don't stampede in sync.
+                    retry_after = resp.headers.get("Retry-After")
+                    if retry_after:
+                        sleep_for = float(retry_after)
+                    else:
+                        sleep_for = random.uniform(0, min(backoff_cap, base_backoff * (2 ** i)))
+                    await asyncio.sleep(sleep_for)
                 else:
                     stats["error"] = f"HTTP {resp.status_code}: {resp.text[:50]}"
                     return None
@@ -111,8 +121,6 @@ class StressHarness:
         print(f"   Target: {self.node_url}")
         print(f"   Concurrency Limit: {self.concurrency}")
 
-        simulators = [MinerSimulator() for _ in range(num_miners)]
-
         # Setup scenarios
         force_ids = [None] * num_miners
         malformed_flags = [False] * num_miners
@@ -140,23 +148,37 @@ class StressHarness:
             else:
                 delay = 0
 
-            tasks.append(self._delayed_session(delay, simulators[i], force_ids[i], malformed_flags[i]))
+            tasks.append(self._delayed_session(delay, force_ids[i], malformed_flags[i]))
 
-        self.results = await asyncio.gather(*tasks)
+        # Consume sessions as they finish so error tallies build incrementally
+        # instead of in a final O(N) pass over the gathered list.
+        for coro in asyncio.as_completed(tasks):
+            self._ingest(await coro)
         duration = time.perf_counter() - start_time
 
         self.print_summary(num_miners, duration)
         await self.client.aclose()
 
-    async def _delayed_session(self, delay, sim, fid, mal):
+    def _ingest(self, result: Dict[str, Any]):
+        """Folds one finished session into the running aggregates.
+
+        Results are still kept for the Markdown reporter, which reads the
+        full list after the run.
+        """
+        self.results.append(result)
+        if not result["success"]:
+            self.error_counts[result.get("error", "Unknown error")] += 1
+
+    async def _delayed_session(self, delay, fid, mal):
         if delay > 0:
             await asyncio.sleep(delay)
-        return await self.run_miner_session(sim, fid, mal)
+        # Construct the simulator only once its session actually starts, so
+        # memory scales with in-flight miners rather than total miners.
+        return await self.run_miner_session(MinerSimulator(), fid, mal)
 
     def print_summary(self, total_miners: int, duration: float):
         """Calculates and prints performance metrics."""
         successes = [r for r in self.results if r["success"]]
-        failures = [r for r in self.results if not r["success"]]
 
         total_times = [r["total_time"] for r in self.results if "total_time" in r]
 
@@ -172,9 +194,9 @@ class StressHarness:
             print(f"\nLatency (Total Session):")
             print(f"  P50 (Median):   {statistics.median(total_times):.3f}s")
             if len(total_times) > 1:
-                total_times.sort()
-                print(f"  P95:            {total_times[int(len(total_times)*0.95)]:.3f}s")
-                print(f"  P99:            {total_times[int(len(total_times)*0.99)]:.3f}s")
+                percentiles = statistics.quantiles(total_times, n=100)
+                print(f"  P95:            {percentiles[94]:.3f}s")
+                print(f"  P99:            {percentiles[98]:.3f}s")
 
         # Breakdown by step
         for step in ["challenge", "submit", "enroll"]:
@@ -182,14 +204,8 @@ class StressHarness:
             if step_times:
                 print(f"  Avg {step.capitalize()}:  {sum(step_times)/len(step_times):.3f}s")
 
-        if failures:
+        if self.error_counts:
             print("\nTop Errors:")
-            error_counts = {}
-            for r in failures:
-                err = r.get("error", "Unknown error")
-                error_counts[err] = error_counts.get(err, 0) + 1
-
-            sorted_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-            for err, count in sorted_errors[:5]:
+            for err, count in self.error_counts.most_common(5):
                 print(f"  - {count}x: {err}")
         print("="*50)
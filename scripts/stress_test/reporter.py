@@ -1,4 +1,5 @@
 import json
+import statistics
 from datetime import datetime
 from typing import List, Dict, Any
 
@@ -18,10 +19,13 @@ class StressTestReporter:
         success_rate = (len(successes) / self.total_miners) * 100 if self.total_miners > 0 else 0
 
         # Calculate latencies
-        total_times = sorted([r["total_time"] for r in self.results if "total_time" in r])
-        p50 = total_times[len(total_times)//2] if total_times else 0
-        p95 = total_times[int(len(total_times)*0.95)] if len(total_times) >= 20 else p50
-        p99 = total_times[int(len(total_times)*0.99)] if len(total_times) >= 100 else p95
+        total_times = [r["total_time"] for r in self.results if "total_time" in r]
+        p50 = statistics.median(total_times) if total_times else 0
+        if len(total_times) > 1:
+            percentiles = statistics.quantiles(total_times, n=100)
+            p95, p99 = percentiles[94], percentiles[98]
+        else:
+            p95 = p99 = p50
 
         md = f"""# RustChain RIP-200 Stress Test Report
 Generated on: `{self.timestamp}`
@@ -52,9 +56,8 @@ Generated on: `{self.timestamp}`
         else:
             md += "- No duplicate ID tests performed in this session.\n"
 
-        md += """
+        md += f"""
 ## ⏱️ Latency Distribution (Total Session)
-"""
 - **P50 (Median):** `{p50:.3f}s`
 - **P95:** `{p95:.3f}s`
 - **P99:** `{p99:.3f}s`